@@ -26,6 +26,6 @@ setuptools.setup(
     packages=['snippet_uiautomator'],
     package_data={'snippet_uiautomator': ['android/app/uiautomator.apk']},
     install_requires=['mobly'],
-    python_requires='>=3.7',
+    python_requires='>=3.10',
     keywords='uiautomator',
 )
@@ -37,7 +37,7 @@ class BySelector:
   https://developer.android.com/reference/androidx/test/uiautomator/BySelector
   """
 
-  SUBSELECTOR = (
+  SUBSELECTOR = frozenset({
       'ancestor',
       'child',
       'parent',
@@ -46,11 +46,13 @@ class BySelector:
       'left',
       'right',
       'top',
-  )
+  })
 
   def __init__(self, **kwargs) -> None:
     """Converts the keyword arguments to selector type."""
-    self._selector = dict(kwargs)
+    # kwargs is already a fresh dict owned by this call, so it can be used
+    # directly without another copy.
+    self._selector = kwargs
     self._bottom = self._selector
 
   def _find_bottom_selector(self, d: NestedSelectorType) -> NestedSelectorType:
@@ -76,8 +78,8 @@ class BySelector:
       raise SelectorError(
           f'Basic selector should not contain sub-selector: {repr(kwargs)}'
       )
-    self._bottom[name] = dict(kwargs)
-    self._bottom = self._bottom[name]
+    self._bottom[name] = kwargs
+    self._bottom = kwargs
 
   def copy(self) -> BySelector:
     """Returns a copy of this selector."""
@@ -87,7 +89,11 @@ class BySelector:
 
   def is_nested(self) -> bool:
     """Checks if this selector will be converted to a nested dictionary."""
-    return any(isinstance(value, dict) for value in self._selector.values())
+    for value in self._selector.values():
+      # Sub-selectors are always plain dicts, so an exact type check suffices.
+      if type(value) is dict:  # pylint: disable=unidiomatic-typecheck
+        return True
+    return False
 
   def to_dict(self) -> NestedSelectorType:
     """Returns a selector as a dictionary."""
@@ -20,11 +20,14 @@ https://developer.android.com/reference/androidx/test/uiautomator/Configurator
 import dataclasses
 import datetime
 import enum
-import functools
 from typing import Mapping, Optional, Sequence
 
 from snippet_uiautomator import utils
 
+# Bound once at import so to_dict skips the module attribute chain on the RPC
+# configuration path.
+_covert_to_millisecond = utils.covert_to_millisecond
+
 
 @enum.unique
 class Flag(enum.IntEnum):
@@ -66,16 +69,26 @@ class ToolType(enum.IntEnum):
   TOOL_TYPE_ERASER = 4
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Timeout:
   """Indicates timers to wait for UiAutomator to take specific actions.
 
   Attributes:
     wait_for_idle: Wait for the user interface to go into an idle state before
       starting a uiautomator action.
+    wait_for_idle_ms: The wait_for_idle timer converted to milliseconds, or
+      None if wait_for_idle is not set. Computed once at construction.
   """
 
   wait_for_idle: Optional[datetime.timedelta] = None
+  wait_for_idle_ms: Optional[int] = dataclasses.field(default=None, init=False)
+
+  def __post_init__(self) -> None:
+    """Converts the timers to milliseconds while the instance is frozen."""
+    if self.wait_for_idle is not None:
+      object.__setattr__(
+          self, 'wait_for_idle_ms', _covert_to_millisecond(self.wait_for_idle)
+      )
 
 
 @dataclasses.dataclass(frozen=True)
@@ -94,23 +107,27 @@ class Configurator:
   timeout: Timeout = Timeout()
   tool_type: Optional[ToolType] = None
 
+  def __post_init__(self) -> None:
+    """Combines the flags into a single mask while the instance is frozen."""
+    flag_mask = 0
+    for flag in self.flags:
+      flag_mask |= flag.value
+    object.__setattr__(self, '_flag_mask', flag_mask)
+
   def to_dict(self) -> Mapping[str, int]:
     """Converts Configurator to the ConfiguratorInfo for the RPC."""
-    config = {}
-
-    if self.tool_type is not None:
-      config['toolType'] = self.tool_type.value
-
-    if len(self.flags) == 1:
-      config['uiAutomationFlags'] = self.flags[0].value
-    elif len(self.flags) > 1:
-      config['uiAutomationFlags'] = functools.reduce(
-          lambda x, y: x | y, self.flags
-      )
-
-    if self.timeout.wait_for_idle is not None:
-      config['waitForIdleTimeout'] = utils.covert_to_millisecond(
-          self.timeout.wait_for_idle
-      )
-
+    cached = getattr(self, '_config_dict', None)
+    if cached is not None:
+      return cached
+
+    entries = (
+        ('toolType', None if self.tool_type is None else self.tool_type.value),
+        ('uiAutomationFlags', self._flag_mask if self.flags else None),
+        ('waitForIdleTimeout', self.timeout.wait_for_idle_ms),
+    )
+    config = {key: value for key, value in entries if value is not None}
+
+    # This dataclass is frozen, so the conversion result never changes and can
+    # be cached on the instance.
+    object.__setattr__(self, '_config_dict', config)
     return config
@@ -22,7 +22,7 @@ DEFAULT_UI_WAIT_TIME = datetime.timedelta(seconds=10)
 DEFAULT_WAIT_FOR_SELECTOR_TIMEOUT = datetime.timedelta(seconds=0)
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Rect:
   """Represents the android.graphics.Rect object.
 
@@ -38,7 +38,7 @@ class Rect:
   top: int
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class Point:
   """Represents the android.graphics.Point object.
 
@@ -14,6 +14,7 @@
 
 """Common errors for Snippet UiAutomator."""
 
+import re
 from typing import Optional
 
 from mobly.controllers import android_device
@@ -35,7 +36,9 @@ ERROR_WHEN_SERVICE_ALREADY_REGISTERED = (
 ERROR_WHEN_SERVICE_NOT_RUNNING = 'Snippet UiAutomator service is not running'
 
 REGEX_UIA_SERVICE_ALREADY_REGISTERED = r'.*UiAutomationService.*registered'
-REGEX_TCP_PORT_NOT_FOUND = rb"adb: error: listener 'tcp:(\d+)' not found\n|$"
+REGEX_TCP_PORT_NOT_FOUND = re.compile(
+    rb"adb: error: listener 'tcp:(\d+)' not found\n|$"
+)
 
 
 class BaseError(Exception):
@@ -45,10 +48,8 @@ class BaseError(Exception):
       self, message: str, ad: Optional[android_device.AndroidDevice] = None
   ) -> None:
     self._ad = ad
-    self._message = message
-
-  def __str__(self) -> str:
-    return self._message if self._ad is None else f'{self._ad} {self._message}'
+    self._message = message if ad is None else f'{ad} {message}'
+    super().__init__(self._message)
 
 
 class ApiError(BaseError):
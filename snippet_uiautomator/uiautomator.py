@@ -16,40 +16,75 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import dataclasses
-import re
-from typing import Optional
+import functools
+import hashlib
+import importlib
+import typing
+from typing import Optional, Sequence
 
 from mobly import utils as mobly_utils
 from mobly.controllers import android_device
 from mobly.controllers.android_device_lib import adb
+from mobly.controllers.android_device_lib import snippet_client_v2
 from mobly.controllers.android_device_lib.services import base_service
 from mobly.snippet import errors as snippet_errors
-from snippet_uiautomator import configurator as uiconfig
-from snippet_uiautomator import constants
 from snippet_uiautomator import errors
-from snippet_uiautomator import uidevice
-from snippet_uiautomator import uiobject2
-from snippet_uiautomator import uiwatcher
 from snippet_uiautomator import utils
 
+if typing.TYPE_CHECKING:
+  from snippet_uiautomator.configurator import Configurator
+  from snippet_uiautomator.configurator import Flag
+  from snippet_uiautomator.configurator import Timeout
+  from snippet_uiautomator.configurator import ToolType
+  from snippet_uiautomator.constants import KeyEvent
+  from snippet_uiautomator.uidevice import UiDevice
+  from snippet_uiautomator.uiobject2 import UiObject2
+  from snippet_uiautomator.uiwatcher import UiWatcher
+
 UIAUTOMATOR_PACKAGE_NAME = 'com.google.android.mobly.snippet.uiautomator'
 
 ANDROID_SERVICE_NAME = 'uiautomator'
 HIDDEN_SERVICE_NAME = '_ui'
 PUBLIC_SERVICE_NAME = 'ui'
 
-Configurator = uiconfig.Configurator
-Flag = uiconfig.Flag
-KeyEvent = constants.KeyEvent
-Timeout = uiconfig.Timeout
-ToolType = uiconfig.ToolType
-UiDevice = uidevice.UiDevice
-UiObject2 = uiobject2.UiObject2
-UiWatcher = uiwatcher.UiWatcher
-
-
-@dataclasses.dataclass
+# The wrapper classes re-exported from this module, resolved lazily so that
+# importing uiautomator does not pull in the whole wrapper package up front.
+_LAZY_ATTRIBUTES = {
+    'Configurator': ('snippet_uiautomator.configurator', 'Configurator'),
+    'Flag': ('snippet_uiautomator.configurator', 'Flag'),
+    'KeyEvent': ('snippet_uiautomator.constants', 'KeyEvent'),
+    'Timeout': ('snippet_uiautomator.configurator', 'Timeout'),
+    'ToolType': ('snippet_uiautomator.configurator', 'ToolType'),
+    'UiDevice': ('snippet_uiautomator.uidevice', 'UiDevice'),
+    'UiObject2': ('snippet_uiautomator.uiobject2', 'UiObject2'),
+    'UiWatcher': ('snippet_uiautomator.uiwatcher', 'UiWatcher'),
+}
+
+
+@functools.cache
+def _background_executor() -> concurrent.futures.ThreadPoolExecutor:
+  """A shared worker pool for overlapping adb round trips."""
+  return concurrent.futures.ThreadPoolExecutor(
+      thread_name_prefix='snippet-uiautomator'
+  )
+
+
+def __getattr__(name: str):
+  """Resolves the re-exported wrapper classes on first access."""
+  try:
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+  except KeyError:
+    raise AttributeError(
+        f'module {__name__!r} has no attribute {name!r}'
+    ) from None
+  value = getattr(importlib.import_module(module_name), attribute)
+  globals()[name] = value
+  return value
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class Snippet:
   """The information of the Mobly Snippet app.
 
@@ -73,7 +108,9 @@ class Snippet:
   custom_service_name: Optional[str] = None
 
 
-@dataclasses.dataclass
+# Not frozen: the service fills in default members and flips skip_installing
+# after the first successful start.
+@dataclasses.dataclass(slots=True)
 class UiAutomatorConfigs:
   """A configuration object for configuring the UiAutomatorService.
 
@@ -92,6 +129,35 @@ class UiAutomatorConfigs:
   raise_error: bool = False
 
 
+def load_uiautomator_service(
+    ads: Sequence[android_device.AndroidDevice],
+    configs: Optional[UiAutomatorConfigs] = None,
+) -> None:
+  """Registers and starts the UiAutomator service on devices in parallel.
+
+  Registering the service installs the snippet apk and launches the snippet
+  server, which takes several seconds per device; running the registrations
+  concurrently bounds the total wait by the slowest device instead of the sum.
+
+  Args:
+    ads: The Mobly Android device controllers to attach the service to.
+    configs: The configuration to apply to every device's service. Each device
+      receives its own shallow copy so the services do not share mutable
+      state.
+  """
+
+  def register(ad: android_device.AndroidDevice) -> None:
+    ad.services.register(
+        ANDROID_SERVICE_NAME,
+        UiAutomatorService,
+        configs=None if configs is None else dataclasses.replace(configs),
+    )
+
+  mobly_utils.concurrent_exec(
+      register, [[ad] for ad in ads], raise_on_exception=True
+  )
+
+
 class UiAutomatorService(base_service.BaseService):
   """A service for operating Snippet UiAutomator."""
 
@@ -100,28 +166,75 @@ class UiAutomatorService(base_service.BaseService):
       ad: android_device.AndroidDevice,
       configs: Optional[UiAutomatorConfigs] = None,
   ) -> None:
+    from snippet_uiautomator import configurator as uiconfig
+
     if configs is None:
       configs = UiAutomatorConfigs()
     if configs.snippet is None:
       configs.snippet = Snippet()
     if configs.configurator is None:
-      configs.configurator = Configurator()
+      configs.configurator = uiconfig.Configurator()
     self._service = (
         configs.snippet.custom_service_name
         or configs.snippet.ui_hidden_service_name
         or HIDDEN_SERVICE_NAME
     )
+    # Snippet is frozen, so these chains can be resolved once up front.
+    self._package_name = configs.snippet.package_name
+    self._file_path = configs.snippet.file_path
+    self._public_name = configs.snippet.ui_public_service_name
+    self._alive = False
+    self._apk_installed: Optional[bool] = None
+    self._client: Optional[snippet_client_v2.SnippetClientV2] = None
+    # The configurator never changes after construction, so the RPC dict can
+    # be reused across service restarts.
+    self._configurator_dict = configs.configurator.to_dict()
     super().__init__(ad, configs)
 
   @property
   def _is_apk_installed(self) -> bool:
-    """Checks if the snippet apk is already installed."""
-    all_packages = self._device.adb.shell(['pm', 'list', 'package'])
-    return bool(
-        mobly_utils.grep(
-            f'^package:{self._configs.snippet.package_name}$', all_packages
+    """Checks if the snippet apk is already installed.
+
+    The result is cached after the first query; installs and uninstalls
+    performed by this service update the cache in place.
+    """
+    if self._apk_installed is None:
+      try:
+        package_path = self._device.adb.shell(
+            ['pm', 'path', self._package_name]
         )
-    )
+      except adb.AdbError:
+        package_path = b''
+      self._apk_installed = bool(package_path.strip())
+    return self._apk_installed
+
+  def _is_same_apk_installed(self) -> bool:
+    """Returns True if the installed apk is identical to the local one.
+
+    Comparing checksums costs two quick shell commands, which is much cheaper
+    than streaming the apk over adb for an unnecessary reinstall. Any failure
+    along the way simply reports a mismatch.
+    """
+    try:
+      package_path = (
+          self._device.adb.shell(['pm', 'path', self._package_name])
+          .decode()
+          .splitlines()[0]
+          .strip()
+          .removeprefix('package:')
+      )
+      if not package_path:
+        return False
+      device_sha = (
+          self._device.adb.shell(['sha256sum', package_path]).decode().split()
+      )
+    except (adb.AdbError, IndexError, UnicodeDecodeError):
+      return False
+    if not device_sha:
+      return False
+    with open(self._file_path, 'rb') as f:
+      local_sha = hashlib.sha256(f.read()).hexdigest()
+    return device_sha[0] == local_sha
 
   def _install_apk(self) -> None:
     """Installs the snippet apk to the Android devices."""
@@ -129,75 +242,114 @@ class UiAutomatorService(base_service.BaseService):
       if not self._is_apk_installed:
         raise errors.ConfigurationError(
             errors.ERROR_WHEN_APK_IS_NOT_INSTALLED.format(
-                package_name=self._configs.snippet.package_name
+                package_name=self._package_name
             ),
             self._device,
         )
     else:
-      if self._is_apk_installed:
-        # In case the existing application is signed with a different key.
-        self._device.adb.uninstall(self._configs.snippet.package_name)
-      self._device.adb.install(['-g', self._configs.snippet.file_path])
-
-  def _load_snippet(self) -> None:
-    """Starts the snippet apk with the given package name and connects."""
-    snippet_manager = self._device.services.snippets
-    if snippet_manager.get_snippet_client(self._service) is not None:
-      self._device.log.info(
+      if self._is_same_apk_installed():
+        self._device.log.debug(
+            'package %s is already installed with the same apk, skipping'
+            ' install',
+            self._package_name,
+        )
+        self._apk_installed = True
+        return
+      # Fast path: a reinstall keeps the install to a single adb round trip.
+      # It fails when the existing application is signed with a different
+      # key, in which case fall back to a clean uninstall + install.
+      try:
+        self._device.adb.install(['-r', '-g', self._file_path])
+      except adb.AdbError:
+        try:
+          self._device.adb.uninstall(self._package_name)
+        except adb.AdbError:
+          pass
+        self._apk_installed = False
+        self._device.adb.install(['-g', self._file_path])
+      self._apk_installed = True
+
+  def _load_snippet(self, start_time: Optional[str] = None) -> None:
+    """Starts the snippet apk with the given package name and connects.
+
+    Args:
+      start_time: A logcat timestamp marking the point from which runtime
+        errors should be attributed to this load attempt. If not given, the
+        latest timestamp is fetched here.
+    """
+    device = self._device
+    if device.services.snippets.get_snippet_client(self._service) is not None:
+      device.log.info(
           'Snippet client %s has already been loaded', self._service
       )
       return
 
-    if self._configs.snippet.package_name is None:
+    if self._package_name is None:
       raise errors.ConfigurationError(
-          errors.ERROR_WHEN_PACKAGE_NAME_MISSING, self._device
+          errors.ERROR_WHEN_PACKAGE_NAME_MISSING, device
       )
-    start_time = utils.get_latest_logcat_timestamp(self._device)
+    if start_time is None:
+      start_time = utils.get_latest_logcat_timestamp(device)
     try:
-      self._device.load_snippet(
-          self._service, self._configs.snippet.package_name
-      )
+      device.load_snippet(self._service, self._package_name)
     except snippet_errors.ServerStartProtocolError as e:
-      if utils.is_uiautomator_service_registered(self._device, start_time):
+      if utils.is_uiautomator_service_registered(device, start_time):
         raise errors.UiAutomationServiceAlreadyRegisteredError(
-            errors.ERROR_WHEN_SERVICE_ALREADY_REGISTERED, self._device
+            errors.ERROR_WHEN_SERVICE_ALREADY_REGISTERED, device
         ) from e
       raise
 
+  @property
+  def _snippet_client(self) -> Optional[snippet_client_v2.SnippetClientV2]:
+    """The underlying snippet client, cached after the snippet is loaded."""
+    if self._client is None:
+      self._client = self._device.services.snippets.get_snippet_client(
+          self._service
+      )
+    return self._client
+
   def _initial_uidevice(self) -> None:
     """Initializes the UiDevice object."""
-    snippet_client = getattr(self._device, self._service)
-    snippet_client.setConfigurator(self._configs.configurator.to_dict())
+    from snippet_uiautomator import uidevice
+
+    snippet_client = self._snippet_client
+    snippet_client.setConfigurator(self._configurator_dict)
     setattr(
         self._device,
-        self._configs.snippet.ui_public_service_name,
-        UiDevice(ui=snippet_client, raise_error=self._configs.raise_error),
+        self._public_name,
+        uidevice.UiDevice(
+            ui=snippet_client, raise_error=self._configs.raise_error
+        ),
     )
 
   @property
   def ui_device(self) -> UiDevice:
     """Gets the UiDevice object."""
+    # A single getattr both fetches the instance and stands in for the
+    # hasattr probe that is_alive would otherwise repeat.
+    service = getattr(self._device, self._public_name, None)
+    if service is not None and self.is_alive:
+      return service
     if not self.is_alive:
       raise errors.ConfigurationError(
           errors.ERROR_WHEN_SERVICE_NOT_RUNNING, self._device
       )
-    service = getattr(
-        self._device, self._configs.snippet.ui_public_service_name, None
+    raise errors.ConfigurationError(
+        errors.ERROR_WHEN_INSTANCE_MISSING.format(instance=self._public_name),
+        self._device,
     )
-    if service is None:
-      raise errors.ConfigurationError(
-          errors.ERROR_WHEN_INSTANCE_MISSING.format(
-              instance=self._configs.snippet.ui_public_service_name
-          ),
-          self._device,
-      )
-    return service
 
   @property
   def is_alive(self) -> bool:
+    # Fast path: the flag is maintained by start() and stop(), so the
+    # attribute probes only run when this service did not start the snippet
+    # itself (e.g. a custom service name loaded by another snippet).
+    if self._alive:
+      return True
+    # The snippet management service is registered unconditionally by mobly's
+    # AndroidDevice, so probing for it is redundant.
     return (
-        hasattr(self._device, self._configs.snippet.ui_public_service_name)
-        and hasattr(self._device.services, 'snippets')
+        hasattr(self._device, self._public_name)
         and self._device.services.snippets.get_snippet_client(self._service)
         is not None
     )
@@ -206,45 +358,52 @@ class UiAutomatorService(base_service.BaseService):
     if self.is_alive:
       self._device.log.debug('uiautomator service has already started')
     else:
+      # Fetch the logcat reference timestamp while the (much slower) apk
+      # install runs, so the two adb round trips overlap.
+      start_time = _background_executor().submit(
+          utils.get_latest_logcat_timestamp, self._device
+      )
       self._install_apk()
-      self._load_snippet()
+      self._load_snippet(start_time.result())
       self._initial_uidevice()
       self._configs.skip_installing = True
+    self._alive = True
 
   def stop(self) -> None:
     if not self.is_alive:
       self._device.log.debug('uiautomator service has already stopped')
       return
+    self._alive = False
 
     if not self._is_apk_installed:
       self._device.log.debug(
           'package %s was uninstalled before stopping the service',
-          self._configs.snippet.package_name,
+          self._package_name,
       )
       return
 
+    self._client = None
     try:
       self._device.unload_snippet(self._service)
     except adb.AdbError as e:
-      if re.fullmatch(errors.REGEX_TCP_PORT_NOT_FOUND, e.stderr) is None:
+      if errors.REGEX_TCP_PORT_NOT_FOUND.fullmatch(e.stderr) is None:
         raise
       self._device.log.exception(
           'listener TCP port has already lost connection before unloading the'
           ' snippet client'
       )
 
-    if hasattr(self._device, self._configs.snippet.ui_public_service_name):
-      delattr(self._device, self._configs.snippet.ui_public_service_name)
+    if hasattr(self._device, self._public_name):
+      delattr(self._device, self._public_name)
     else:
       self._device.log.debug(
           'class UiDevice %s was deleted before stopping the service',
-          self._configs.snippet.ui_public_service_name,
+          self._public_name,
       )
 
   def pause(self):
     if self.is_alive:
-      client = self._device.services.snippets.get_snippet_client(self._service)
-      client.close_connection()
+      self._snippet_client.close_connection()
       self._device.log.debug('uiautomator service is paused')
     else:
       self._device.log.debug('uiautomator service has already paused')
@@ -253,6 +412,5 @@ class UiAutomatorService(base_service.BaseService):
     if self.is_alive:
       self._device.log.debug('uiautomator service has already resumed')
     else:
-      client = self._device.services.snippets.get_snippet_client(self._service)
-      client.restore_server_connection()
+      self._snippet_client.restore_server_connection()
       self._device.log.debug('uiautomator service is resumed')
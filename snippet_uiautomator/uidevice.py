@@ -17,9 +17,9 @@
 https://developer.android.com/reference/androidx/test/uiautomator/UiDevice
 """
 
+import functools
 import pathlib
 from typing import Callable, Literal, Mapping, Optional, Sequence, Union, overload
-import xml
 
 from mobly.controllers.android_device_lib import snippet_client_v2
 from snippet_uiautomator import byselector
@@ -45,6 +45,45 @@ class _Open:
     return self._ui.openQuickSettings()
 
 
+# The default wait converted once, so calls that keep the default timeout
+# skip the per-call millisecond conversion.
+_DEFAULT_UI_WAIT_TIME_MS = utils.covert_to_millisecond(
+    constants.DEFAULT_UI_WAIT_TIME
+)
+
+# Maps each settable orientation to its snippet RPC name.
+_SET_ORIENTATION_RPC_NAME = {
+    constants.Orientation.NATURAL: 'setOrientationNatural',
+    constants.Orientation.LEFT: 'setOrientationLeft',
+    constants.Orientation.RIGHT: 'setOrientationRight',
+}
+
+# Maps the dot-notation button names to their dedicated snippet RPCs.
+_PRESS_RPC_NAME = {
+    'back': 'pressBack',
+    'center': 'pressDPadCenter',
+    'delete': 'pressDelete',
+    'down': 'pressDPadDown',
+    'enter': 'pressEnter',
+    'home': 'pressHome',
+    'left': 'pressDPadLeft',
+    'menu': 'pressMenu',
+    'recent': 'pressRecentApps',
+    'right': 'pressDPadRight',
+    'search': 'pressSearch',
+    'up': 'pressDPadUp',
+}
+
+# Maps the button names without a dedicated RPC to their Android key codes.
+_PRESS_KEYCODE = {
+    'camera': 0x0000001B,
+    'power': 0x0000001A,
+    'volume_down': 0x00000019,
+    'volume_mute': 0x000000A4,
+    'volume_up': 0x00000018,
+}
+
+
 class _Press:
   """Performs a press action on this device."""
 
@@ -64,30 +103,20 @@ class _Press:
 
   def __getattr__(self, keycode: str) -> Callable[[], bool]:
     """Calls the press action via dot notation."""
-
-    def wrapper():
-      return self._press(keycode)
-
+    wrapper = functools.partial(self._press, keycode)
+    # Cache the wrapper on the instance so repeated accesses to the same
+    # button bypass __getattr__ and the closure allocation.
+    setattr(self, keycode, wrapper)
     return wrapper
 
   def _press(self, keycode: str) -> bool:
     """Simulates a short press on the specific button."""
-    if keycode in ('back', 'delete', 'enter', 'home', 'menu', 'search'):
-      return getattr(self._ui, f'press{keycode.capitalize()}')()
-    elif keycode in ('center', 'down', 'left', 'right', 'up'):
-      return getattr(self._ui, f'pressDPad{keycode.capitalize()}')()
-    elif keycode == 'camera':
-      return self._ui.pressKeyCode(0x0000001B)
-    elif keycode == 'power':
-      return self._ui.pressKeyCode(0x0000001A)
-    elif keycode == 'recent':
-      return self._ui.pressRecentApps()
-    elif keycode == 'volume_down':
-      return self._ui.pressKeyCode(0x00000019)
-    elif keycode == 'volume_mute':
-      return self._ui.pressKeyCode(0x000000A4)
-    elif keycode == 'volume_up':
-      return self._ui.pressKeyCode(0x00000018)
+    rpc_name = _PRESS_RPC_NAME.get(keycode)
+    if rpc_name is not None:
+      return getattr(self._ui, rpc_name)()
+    key = _PRESS_KEYCODE.get(keycode)
+    if key is not None:
+      return self._ui.pressKeyCode(key)
     raise AttributeError(
         f"{self._device} '_Press' object has no attribute {repr(keycode)}"
     )
@@ -129,7 +158,11 @@ class _Wait:
     Returns:
       True if the current application idle in time, False otherwise.
     """
-    timeout_ms = utils.covert_to_millisecond(timeout)
+    timeout_ms = (
+        _DEFAULT_UI_WAIT_TIME_MS
+        if timeout is constants.DEFAULT_UI_WAIT_TIME
+        else utils.covert_to_millisecond(timeout)
+    )
     return self._ui.waitForIdle(timeout_ms)
 
   def update(
@@ -147,7 +180,11 @@ class _Wait:
     Returns:
       True if a window content update event occurs in time, False otherwise.
     """
-    timeout_ms = utils.covert_to_millisecond(timeout)
+    timeout_ms = (
+        _DEFAULT_UI_WAIT_TIME_MS
+        if timeout is constants.DEFAULT_UI_WAIT_TIME
+        else utils.covert_to_millisecond(timeout)
+    )
     return self._ui.waitForWindowUpdate(package, timeout_ms)
 
 
@@ -165,7 +202,6 @@ class UiDevice:
     self._ui = ui
     self._compressed = False
     self._device = self._ui._device  # pylint: disable=protected-access
-    self._serial = self._device.serial
     self._raise_error = raise_error
     self.log_path = pathlib.Path(self._device.log_path)
 
@@ -204,9 +240,14 @@ class UiDevice:
     """The name of the last package to report accessibility events."""
     return self._ui.getCurrentPackageName()
 
-  @property
+  @functools.cached_property
   def product(self) -> str:
-    """The product name of this device."""
+    """The product name of this device.
+
+    The product name never changes for a running device, so the RPC result is
+    cached after the first read. Mutable properties such as height, width and
+    orientation deliberately stay uncached.
+    """
     return self._ui.getProductName()
 
   @property
@@ -227,33 +268,29 @@ class UiDevice:
   @orientation.setter
   def orientation(self, new_orientation: constants.Orientation) -> None:
     """Sets orientation and freezes rotation."""
-    if new_orientation == constants.Orientation.NATURAL:
-      self._ui.setOrientationNatural()
-    elif new_orientation == constants.Orientation.LEFT:
-      self._ui.setOrientationLeft()
-    elif new_orientation == constants.Orientation.RIGHT:
-      self._ui.setOrientationRight()
-    else:
+    rpc_name = _SET_ORIENTATION_RPC_NAME.get(new_orientation)
+    if rpc_name is None:
       raise errors.UiAutomatorError(
           f'Cannot set orientation to {new_orientation}.', self._device
       )
+    getattr(self._ui, rpc_name)()
 
-  @property
+  @functools.cached_property
   def open(self) -> _Open:
     """Performs a open gesture on this device."""
     return _Open(self._ui)
 
-  @property
+  @functools.cached_property
   def press(self) -> _Press:
     """Performs a press action on this device."""
     return _Press(self._ui)
 
-  @property
+  @functools.cached_property
   def screen(self) -> _Screen:
     """Performs screen on/off action on this device."""
     return _Screen(self._ui)
 
-  @property
+  @functools.cached_property
   def wait(self) -> _Wait:
     """Performs wait action on this device."""
     return _Wait(self._ui)
@@ -271,13 +308,29 @@ class UiDevice:
     """Freezes/Unfreezes the device rotation."""
     return self._ui.freezeRotation() if freeze else self._ui.unfreezeRotation()
 
+  def press_sequence(self, *keycodes: int, meta: Optional[int] = None) -> bool:
+    """Presses a sequence of key codes in a single RPC.
+
+    https://developer.android.com/reference/android/view/KeyEvent
+
+    Args:
+      *keycodes: The key codes to press, in order.
+      meta: The meta key state to apply to every key press.
+
+    Returns:
+      True if all key presses are injected successfully, False otherwise.
+    """
+    return self._ui.pressKeyCodes(list(keycodes), meta)
+
   def find(self, **kwargs) -> Sequence[byselector.SelectorType]:
     """Finds all objects to match the selector criteria."""
-    return self._ui.findObjects((byselector.BySelector(**kwargs).to_dict()))
+    # One-shot selectors serialize to exactly the kwargs dict, so skip the
+    # intermediate BySelector round trip.
+    return self._ui.findObjects(kwargs)
 
   def has(self, **kwargs) -> bool:
     """Returns if there is a match for the given criteria."""
-    return self._ui.hasObject(byselector.BySelector(**kwargs).to_dict())
+    return self._ui.hasObject(kwargs)
 
   def clear_cache(self) -> bool:
     """Clears the accessibility cache, applicable to sdk 34 or higher."""
@@ -380,18 +433,26 @@ class UiDevice:
       self._compressed = compressed
       self._ui.setCompressedLayoutHierarchy(compressed)
 
-    def process_content(xml_content: str) -> str:
-      if pretty and '\n ' not in content:
-        return xml.dom.minidom.parseString(xml_content).toprettyxml(indent='  ')
-      else:
-        return xml_content
-
     content = self._ui.dump()
+    needs_pretty = pretty and '\n ' not in content
+    if needs_pretty:
+      # minidom is only needed for re-indenting, so keep it off the module
+      # import path.
+      import xml.dom.minidom  # pylint: disable=g-import-not-at-top
     if file:
       file_name = self._device.generate_filename('dump', extension_name='xml')
       file_path = self.log_path.joinpath(file_name)
       with open(file_path, 'w', encoding='utf8') as f:
-        f.write(process_content(content))
+        if needs_pretty:
+          # Stream the pretty-printed document straight into the file instead
+          # of materializing a second copy of the XML in memory.
+          xml.dom.minidom.parseString(content).writexml(
+              f, addindent='  ', newl='\n'
+          )
+        else:
+          f.write(content)
       return file_path
 
-    return process_content(content)
+    if needs_pretty:
+      return xml.dom.minidom.parseString(content).toprettyxml(indent='  ')
+    return content
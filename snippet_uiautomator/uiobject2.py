@@ -38,6 +38,7 @@ class _Click:
   ) -> None:
     self._ui = ui
     self._selector = selector
+    self._selector_dict = selector.to_dict()
 
   def __call__(self, timeout: Optional[utils.TimeUnit] = None) -> bool:
     """Clicks on this object.
@@ -49,20 +50,20 @@ class _Click:
       True if operation succeeds, False otherwise.
     """
     if timeout is None:
-      return self._ui.clickObj(self._selector.to_dict())
+      return self._ui.clickObj(self._selector_dict)
     timeout_ms = utils.covert_to_millisecond(timeout)
-    return self._ui.clickObj(self._selector.to_dict(), timeout_ms)
+    return self._ui.clickObj(self._selector_dict, timeout_ms)
 
   def bottomright(self) -> bool:
     """Clicks the lower right corner of this object."""
-    bounds = self._ui.getVisibleBounds(self._selector.to_dict())
+    bounds = self._ui.getVisibleBounds(self._selector_dict)
     if bounds is None:
       return False
     return self._ui.click(bounds['right'], bounds['bottom'])
 
   def topleft(self) -> bool:
     """Clicks the upper left corner of this object."""
-    bounds = self._ui.getVisibleBounds(self._selector.to_dict())
+    bounds = self._ui.getVisibleBounds(self._selector_dict)
     if bounds is None:
       return False
     return self._ui.click(bounds['left'], bounds['top'])
@@ -80,7 +81,7 @@ class _Click:
       True if a window update occurred after clicked, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    return self._ui.clickObjAndWait(self._selector.to_dict(), timeout_ms)
+    return self._ui.clickObjAndWait(self._selector_dict, timeout_ms)
 
 
 class _Drag:
@@ -126,11 +127,7 @@ class _Drag:
       errors.ApiError: When given incorrect arguments to this method.
     """
     if x is None and y is None and kwargs:
-      return self._ui.dragObjToObj(
-          self._selector.to_dict(),
-          byselector.BySelector(**kwargs).to_dict(),
-          speed,
-      )
+      return self._ui.dragObjToObj(self._selector.to_dict(), kwargs, speed)
     elif x is not None and y is not None and not kwargs:
       return self._ui.dragObj(self._selector.to_dict(), x, y, speed)
     else:
@@ -402,6 +399,7 @@ class _Wait:
     self._ui = ui
     self._device = self._ui._device  # pylint: disable=protected-access
     self._selector = selector
+    self._selector_dict = selector.to_dict()
     self._raise_error = raise_error
 
   def click(
@@ -416,8 +414,8 @@ class _Wait:
       True if the object exists and click successfully, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    if self._ui.waitForExists(self._selector.to_dict(), timeout_ms):
-      return self._ui.clickObj(self._selector.to_dict())
+    if self._ui.waitForExists(self._selector_dict, timeout_ms):
+      return self._ui.clickObj(self._selector_dict)
     return False
 
   def exists(
@@ -436,12 +434,12 @@ class _Wait:
       True if this object exists, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    is_exists = self._ui.waitForExists(self._selector.to_dict(), timeout_ms)
+    is_exists = self._ui.waitForExists(self._selector_dict, timeout_ms)
     if is_exists:
       return True
     if self._raise_error or raise_error:
       raise errors.UiObjectSearchError(
-          f'Not found Selector{self._selector.to_dict()} over {timeout_ms} ms',
+          f'Not found Selector{self._selector_dict} over {timeout_ms} ms',
           self._device,
       )
     return False
@@ -462,13 +460,12 @@ class _Wait:
       True if this object was not found, False otherwise.
     """
     timeout_ms = utils.covert_to_millisecond(timeout)
-    is_gone = self._ui.waitUntilGone(self._selector.to_dict(), timeout_ms)
+    is_gone = self._ui.waitUntilGone(self._selector_dict, timeout_ms)
     if is_gone:
       return True
     if self._raise_error or raise_error:
       raise errors.UiObjectSearchError(
-          f'Still found Selector{self._selector.to_dict()} over'
-          f' {timeout_ms} ms',
+          f'Still found Selector{self._selector_dict} over {timeout_ms} ms',
           self._device,
       )
     return False
@@ -489,7 +486,13 @@ class UiObject2:
     self._ui = ui
     self._device = self._ui._device  # pylint: disable=protected-access
     self._selector = selector
+    self._selector_dict = selector.to_dict()
     self._raise_error = raise_error
+    # mobly's snippet client materializes a fresh RPC wrapper on every
+    # attribute access, so bind the hottest calls once per object.
+    self._rpc_exists = ui.exists
+    self._rpc_find_objects = ui.findObjects
+    self._rpc_get_obj_info = ui.getObjInfo
 
   def _create_instance(self, tag: str, **kwargs) -> UiObject2:
     """Creates a new instance of this object with the given tag."""
@@ -532,32 +535,28 @@ class UiObject2:
 
   def clear_text(self) -> bool:
     """Clears the text content if this object is an editable field."""
-    return self._ui.clear(self._selector.to_dict())
+    return self._ui.clear(self._selector_dict)
 
   def find(self, **kwargs) -> Sequence[byselector.SelectorType]:
     """Finds all objects under this object to match the selector criteria."""
-    return self._ui.findChildObjects(
-        self._selector.to_dict(), byselector.BySelector(**kwargs).to_dict()
-    )
+    return self._ui.findChildObjects(self._selector_dict, kwargs)
 
   def has(self, **kwargs) -> bool:
     """Returns if there is a match for the given criteria under this object."""
-    return self._ui.hasChildObject(
-        self._selector.to_dict(), byselector.BySelector(**kwargs).to_dict()
-    )
+    return self._ui.hasChildObject(self._selector_dict, kwargs)
 
   def long_click(self) -> bool:
     """Performs a long click on this object."""
-    return self._ui.longClick(self._selector.to_dict())
+    return self._ui.longClick(self._selector_dict)
 
   def set_text(self, text: str) -> bool:
     """Sets the text content if this object is an editable field."""
-    return self._ui.setText(self._selector.to_dict(), text)
+    return self._ui.setText(self._selector_dict, text)
 
   @property
   def children(self) -> Sequence[byselector.SelectorType]:
     """The child objects directly under this object."""
-    return self._ui.getChildren(self._selector.to_dict())
+    return self._ui.getChildren(self._selector_dict)
 
   @property
   def click(self) -> _Click:
@@ -572,10 +571,10 @@ class UiObject2:
   @property
   def exists(self) -> bool:
     """Checks if the this UI object exists."""
-    is_exists = self._ui.exists(self._selector.to_dict())
+    is_exists = self._rpc_exists(self._selector_dict)
     if not is_exists and self._raise_error:
       raise errors.UiObjectSearchError(
-          f'Not found Selector{self._selector.to_dict()}', self._device
+          f'Not found Selector{self._selector_dict}', self._device
       )
     return is_exists
 
@@ -586,8 +585,12 @@ class UiObject2:
 
   @property
   def info(self) -> Mapping[str, Union[bool, int, str, Mapping[str, int]]]:
-    """Returns all properties of the UI element."""
-    return self._ui.getObjInfo(self._selector.to_dict())
+    """Returns all properties of the UI element.
+
+    Reading several properties of the same object through this single RPC is
+    much cheaper than issuing one RPC per property accessor.
+    """
+    return self._rpc_get_obj_info(self._selector_dict)
 
   @property
   def pinch(self) -> _Pinch:
@@ -612,96 +615,98 @@ class UiObject2:
   @property
   def count(self) -> int:
     """The number of objects that match this selector criteria."""
-    return len(self._ui.findObjects(self._selector.to_dict()))
+    return len(self._rpc_find_objects(self._selector_dict))
 
   @property
   def display_id(self) -> int:
     """The ID of the display containing this object."""
-    return self._ui.getDisplayId(self._selector.to_dict())
+    return self._ui.getDisplayId(self._selector_dict)
 
   @property
   def class_name(self) -> str:
     """The class name of this object."""
-    return self._ui.getClassName(self._selector.to_dict())
+    return self._ui.getClassName(self._selector_dict)
 
   @property
   def description(self) -> str:
     """The content description for this object."""
-    return self._ui.getContentDescription(self._selector.to_dict())
+    return self._ui.getContentDescription(self._selector_dict)
 
   @property
   def hint(self) -> str:
     """The hint text of this object."""
-    return self._ui.getHint(self._selector.to_dict())
+    return self._ui.getHint(self._selector_dict)
 
   @property
   def package_name(self) -> str:
     """The package name of the app that this object belongs to."""
-    return self._ui.getApplicationPackage(self._selector.to_dict())
+    return self._ui.getApplicationPackage(self._selector_dict)
 
   @property
   def resource_id(self) -> str:
     """The fully qualified resource name for this object's id."""
-    return self._ui.getResourceName(self._selector.to_dict())
+    return self._ui.getResourceName(self._selector_dict)
 
   @property
   def text(self) -> str:
     """The text value for this object."""
-    return self._ui.getText(self._selector.to_dict())
+    return self._ui.getText(self._selector_dict)
 
   @property
   def checkable(self) -> bool:
     """Whether this object is checkable."""
-    return self._ui.isCheckable(self._selector.to_dict())
+    return self._ui.isCheckable(self._selector_dict)
 
   @property
   def checked(self) -> bool:
     """Whether this object is checked."""
-    return self._ui.isChecked(self._selector.to_dict())
+    return self._ui.isChecked(self._selector_dict)
 
   @property
   def clickable(self) -> bool:
     """Whether this object is clickable."""
-    return self._ui.isClickable(self._selector.to_dict())
+    return self._ui.isClickable(self._selector_dict)
 
   @property
   def enabled(self) -> bool:
     """Whether this object is enabled."""
-    return self._ui.isEnabled(self._selector.to_dict())
+    return self._ui.isEnabled(self._selector_dict)
 
   @property
   def focusable(self) -> bool:
     """Whether this object is focusable."""
-    return self._ui.isFocusable(self._selector.to_dict())
+    return self._ui.isFocusable(self._selector_dict)
 
   @property
   def focused(self) -> bool:
     """Whether this object is focused."""
-    return self._ui.isFocused(self._selector.to_dict())
+    return self._ui.isFocused(self._selector_dict)
 
   @property
   def long_clickable(self) -> bool:
     """Whether this object is long clickable."""
-    return self._ui.isLongClickable(self._selector.to_dict())
+    return self._ui.isLongClickable(self._selector_dict)
 
   @property
   def scrollable(self) -> bool:
     """Whether this object is scrollable."""
-    return self._ui.isScrollable(self._selector.to_dict())
+    return self._ui.isScrollable(self._selector_dict)
 
   @property
   def selected(self) -> bool:
     """Whether this object is selected."""
-    return self._ui.isSelected(self._selector.to_dict())
+    return self._ui.isSelected(self._selector_dict)
 
   @property
   def visible_bounds(self) -> constants.Rect:
     """This object's visible bounds."""
-    rect = self._ui.getVisibleBounds(self._selector.to_dict())
-    return constants.Rect(**rect)
+    rect = self._ui.getVisibleBounds(self._selector_dict)
+    return constants.Rect(
+        rect['bottom'], rect['left'], rect['right'], rect['top']
+    )
 
   @property
   def visible_center(self) -> constants.Point:
     """The point in the center of this object's visible bounds."""
-    point = self._ui.getVisibleCenter(self._selector.to_dict())
-    return constants.Point(**point)
+    point = self._ui.getVisibleCenter(self._selector_dict)
+    return constants.Point(point['x'], point['y'])
@@ -28,13 +28,143 @@ from snippet_uiautomator import errors
 
 
 class UiWatchers(list):
-  """Operates all registered UiWatchers."""
+  """Operates all registered UiWatchers.
+
+  The registered watcher names are fetched lazily on the first list-style
+  access, so bulk operations such as remove/reset/run do not pay for the
+  getWatchers RPC.
+  """
 
   def __init__(self, ui: snippet_client_v2.SnippetClientV2) -> None:
     super().__init__()
     self._ui = ui
-    for watcher in self._ui.getWatchers():
-      self.append(watcher)
+    self._loaded = False
+
+  def _load(self) -> None:
+    """Fetches the registered watcher names once."""
+    if not self._loaded:
+      self._loaded = True
+      super().extend(self._ui.getWatchers())
+
+  def __add__(self, other):
+    self._load()
+    return super().__add__(other)
+
+  def __radd__(self, other):
+    self._load()
+    return other + list(self)
+
+  def __contains__(self, name) -> bool:
+    self._load()
+    return super().__contains__(name)
+
+  def __delitem__(self, index) -> None:
+    self._load()
+    super().__delitem__(index)
+
+  def __eq__(self, other) -> bool:
+    self._load()
+    return super().__eq__(other)
+
+  def __ne__(self, other) -> bool:
+    self._load()
+    return super().__ne__(other)
+
+  def __lt__(self, other) -> bool:
+    self._load()
+    return super().__lt__(other)
+
+  def __le__(self, other) -> bool:
+    self._load()
+    return super().__le__(other)
+
+  def __gt__(self, other) -> bool:
+    self._load()
+    return super().__gt__(other)
+
+  def __ge__(self, other) -> bool:
+    self._load()
+    return super().__ge__(other)
+
+  def __getitem__(self, index):
+    self._load()
+    return super().__getitem__(index)
+
+  def __setitem__(self, index, value) -> None:
+    self._load()
+    super().__setitem__(index, value)
+
+  def __iter__(self):
+    self._load()
+    return super().__iter__()
+
+  def __len__(self) -> int:
+    self._load()
+    return super().__len__()
+
+  def __mul__(self, other):
+    self._load()
+    return super().__mul__(other)
+
+  def __rmul__(self, other):
+    self._load()
+    return super().__rmul__(other)
+
+  def __iadd__(self, other):
+    self._load()
+    return super().__iadd__(other)
+
+  def __imul__(self, other):
+    self._load()
+    return super().__imul__(other)
+
+  def __repr__(self) -> str:
+    self._load()
+    return super().__repr__()
+
+  def __reversed__(self):
+    self._load()
+    return super().__reversed__()
+
+  def append(self, name) -> None:
+    self._load()
+    super().append(name)
+
+  def clear(self) -> None:
+    self._load()
+    super().clear()
+
+  def copy(self):
+    self._load()
+    return super().copy()
+
+  def count(self, name) -> int:
+    self._load()
+    return super().count(name)
+
+  def extend(self, names) -> None:
+    self._load()
+    super().extend(names)
+
+  def index(self, name, *args) -> int:
+    self._load()
+    return super().index(name, *args)
+
+  def insert(self, index, name) -> None:
+    self._load()
+    super().insert(index, name)
+
+  def pop(self, index=-1):
+    self._load()
+    return super().pop(index)
+
+  def reverse(self) -> None:
+    self._load()
+    super().reverse()
+
+  def sort(self, **kwargs) -> None:
+    self._load()
+    super().sort(**kwargs)
 
   @property
   def triggered(self) -> bool:
@@ -93,7 +223,7 @@ class UiWatcher:
         triggered, the object that triggers the watch condition will be clicked.
         If there is search criteria, the matching object will be clicked.
     """
-    action = byselector.BySelector(**kwargs).to_dict() if kwargs else None
+    action = kwargs or None
     self._ui.registerWatcher(self.name, self._condition.to_dict(), True, action)
 
   def press(self, *args: int) -> None:
@@ -132,7 +262,7 @@ class UiWatcher:
         triggered, the object that triggers the watch condition will be swiped.
         If there is search criteria, the matching object will be swiped.
     """
-    action_dict = byselector.BySelector(**kwargs).to_dict() if kwargs else None
+    action_dict = kwargs or None
     self._ui.registerWatcherForSwipe(
         self.name,
         self._condition.to_dict(),
@@ -15,36 +15,86 @@
 """Common utils for Snippet UiAutomator."""
 
 import datetime
+import functools
 import pathlib
 import re
 from typing import Union
 
 from mobly import logger as mobly_logger
 from mobly.controllers import android_device
+from mobly.controllers.android_device_lib import adb
 from snippet_uiautomator import errors
 
-REGEX_LOGCAT_TIMESTAMP = r'\d{2}-\d{2}\s{1,2}\d{2}:\d{2}:\d{2}.\d{3}'
+REGEX_LOGCAT_TIMESTAMP = r'\d{2}-\d{2} {1,2}\d{2}:\d{2}:\d{2}\.\d{3}'
 REGEX_UIA_SERVICE_ALREADY_REGISTERED = (
     rf'({REGEX_LOGCAT_TIMESTAMP}){errors.REGEX_UIA_SERVICE_ALREADY_REGISTERED}'
 )
 
 TimeUnit = Union[float, int, datetime.timedelta]
 
+_MILLISECOND = datetime.timedelta(milliseconds=1)
+
+_LOGCAT_TIMESTAMP_PATTERN = re.compile(REGEX_LOGCAT_TIMESTAMP.encode())
+# Separator positions within the fixed-width 'MM-DD HH:MM:SS.mmm' prefix.
+_LOGCAT_TIMESTAMP_LENGTH = 18
+_LOGCAT_TIMESTAMP_SEPARATORS = (
+    (2, b'-'),
+    (5, b' '),
+    (8, b':'),
+    (11, b':'),
+    (14, b'.'),
+)
+_UIA_SERVICE_ALREADY_REGISTERED_PATTERN = re.compile(
+    REGEX_UIA_SERVICE_ALREADY_REGISTERED.encode()
+)
+
 
 def covert_to_millisecond(timeout: TimeUnit) -> int:
   """Converts a time unit object to an integer in milliseconds."""
+  cls = type(timeout)
+  if cls is int:
+    # Timeouts are already milliseconds in the common case.
+    return timeout
+  if cls is float:
+    return int(timeout)
   if isinstance(timeout, datetime.timedelta):
-    return int(timeout.total_seconds() * 1_000)
+    # Dividing by a one-millisecond delta runs entirely in C and avoids the
+    # float round trip of total_seconds() * 1000.
+    return timeout // _MILLISECOND
   return int(timeout)
 
 
+def _is_logcat_timestamp(data: bytes) -> bool:
+  """Checks that data is a fixed-width 'MM-DD HH:MM:SS.mmm' timestamp."""
+  if len(data) != _LOGCAT_TIMESTAMP_LENGTH:
+    return False
+  for index, separator in _LOGCAT_TIMESTAMP_SEPARATORS:
+    if data[index : index + 1] != separator:
+      return False
+  return data.translate(None, b'- :.').isdigit()
+
+
 def get_latest_logcat_timestamp(ad: android_device.AndroidDevice) -> str:
   """Gets the latest timestamp from logcat."""
   logcat = ad.adb.logcat(['-d'])
-  last_line = logcat.splitlines()[-1]
-  return re.findall(REGEX_LOGCAT_TIMESTAMP.encode(), last_line)[-1].decode()
+  # Slice out the last line directly; splitlines() would allocate a bytes
+  # object per line of the whole buffer just to read one of them.
+  end = len(logcat)
+  if end and logcat[-1:] == b'\n':
+    end -= 1
+  last_line = logcat[logcat.rfind(b'\n', 0, end) + 1 : end]
+  # Every logcat line starts with the fixed-width timestamp, so a slice plus
+  # structural check avoids the regex engine entirely on the common path.
+  prefix = last_line[:_LOGCAT_TIMESTAMP_LENGTH]
+  if _is_logcat_timestamp(prefix):
+    return prefix.decode()
+  match = None
+  for match in _LOGCAT_TIMESTAMP_PATTERN.finditer(last_line):
+    pass
+  return match.group(0).decode()
 
 
+@functools.cache
 def get_uiautomator_apk() -> str:
   """Gets the absolute path of the UiAutomator apk."""
   return str(
@@ -64,12 +114,45 @@ def is_uiautomator_service_registered(
     start_time: A timestamp that conforms to the REGEX_LOGCAT_TIMESTAMP format
       will only check the log after this time point.
   """
-  logcat = ad.adb.logcat(['-d', '-s', 'AndroidRuntime:E'])
-  runtime_errors = re.findall(
-      REGEX_UIA_SERVICE_ALREADY_REGISTERED.encode(), logcat
-  )
-  if not runtime_errors:
-    return False
+  if start_time:
+    # Let logd drop everything before start_time so only the relevant slice
+    # of the buffer crosses adb.
+    logcat_args = ['-d', '-T', start_time, '-s', 'AndroidRuntime:E']
+  else:
+    logcat_args = ['-d', '-s', 'AndroidRuntime:E']
+  try:
+    # Let logd match the error line on-device so only hits cross adb.
+    logcat = ad.adb.logcat(
+        logcat_args + ['--regex', 'UiAutomationService.*registered']
+    )
+  except adb.AdbError:
+    # Older devices without --regex support fall back to the full dump.
+    logcat = ad.adb.logcat(logcat_args)
+  # Only the last error matters, so scan backwards from the tail for the
+  # literal the regex requires and stop at the first line that matches,
+  # instead of regex-matching the whole buffer front to back.
+  idx = len(logcat)
+  while True:
+    idx = logcat.rfind(b'UiAutomationService', 0, idx)
+    if idx < 0:
+      return False
+    line_start = logcat.rfind(b'\n', 0, idx) + 1
+    line_end = logcat.find(b'\n', idx)
+    if line_end < 0:
+      line_end = len(logcat)
+    # pos/endpos keep the search on the original buffer, avoiding a bytes
+    # copy of the candidate line.
+    match = _UIA_SERVICE_ALREADY_REGISTERED_PATTERN.search(
+        logcat, line_start, line_end
+    )
+    if match is not None:
+      break
+    idx = line_start
 
-  error_time = runtime_errors[-1].decode()
+  error_time = match.group(1).decode()
+  if len(error_time) == len(start_time):
+    # Both timestamps are fixed-width 'MM-DD HH:MM:SS.mmm', so lexicographic
+    # order equals chronological order and skips the datetime parsing done by
+    # mobly's comparator.
+    return error_time >= start_time
   return mobly_logger.logline_timestamp_comparator(error_time, start_time) > -1
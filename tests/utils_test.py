@@ -17,6 +17,7 @@ import datetime
 import pathlib
 from unittest import mock
 
+from mobly.controllers.android_device_lib import adb
 import pytest
 from snippet_uiautomator import utils
 
@@ -83,6 +84,64 @@ def test_is_uiautomator_service_registered_when_registered():
   assert is_registered
 
 
+def test_is_uiautomator_service_registered_skips_non_matching_mentions():
+  start_time = '09-20 17:17:19.549'
+  mock_ad = mock.Mock()
+  mock_ad.adb.logcat.return_value = (
+      b'09-20 17:17:19.500 20159 20159 I ActivityManager: Starting'
+      b' UiAutomationService\n09-20 17:17:19.550 20159 20159 E AndroidRuntime:'
+      b' Caused by: java.lang.IllegalStateException: UiAutomationService'
+      b' android.accessibilityservice.IAccessibilityServiceClient$Stub$Proxy@fabaa34already'
+      b' registered!\nStack trace mentioning UiAutomationService without a'
+      b' timestamp\n'
+  )
+
+  is_registered = utils.is_uiautomator_service_registered(mock_ad, start_time)
+
+  assert is_registered
+
+
+def test_is_uiautomator_service_registered_when_regex_filter_unsupported():
+  start_time = '09-20 17:17:19.549'
+  mock_ad = mock.Mock()
+  mock_ad.adb.logcat.side_effect = [
+      adb.AdbError('logcat', b'', b'Unrecognized Option', 1),
+      (
+          b'09-20 17:17:19.550 20159 20159 E AndroidRuntime: Caused by:'
+          b' java.lang.IllegalStateException: UiAutomationService'
+          b' android.accessibilityservice.IAccessibilityServiceClient$Stub$Proxy@fabaa34already'
+          b' registered!\n'
+      ),
+  ]
+
+  is_registered = utils.is_uiautomator_service_registered(mock_ad, start_time)
+
+  assert is_registered
+  assert mock_ad.adb.logcat.call_count == 2
+  assert '--regex' not in mock_ad.adb.logcat.call_args.args[0]
+
+
+def test_is_uiautomator_service_registered_with_mismatched_timestamp_width():
+  start_time = '09-20 17:17:19.55'
+  mock_ad = mock.Mock()
+  mock_ad.adb.logcat.return_value = (
+      b'09-20 17:17:19.550 20159 20159 E AndroidRuntime: Caused by:'
+      b' java.lang.IllegalStateException: UiAutomationService'
+      b' android.accessibilityservice.IAccessibilityServiceClient$Stub$Proxy@fabaa34already'
+      b' registered!\n'
+  )
+
+  with mock.patch.object(
+      utils.mobly_logger,
+      'logline_timestamp_comparator',
+      wraps=utils.mobly_logger.logline_timestamp_comparator,
+  ) as mock_comparator:
+    is_registered = utils.is_uiautomator_service_registered(mock_ad, start_time)
+
+  assert is_registered
+  mock_comparator.assert_called_once_with('09-20 17:17:19.550', start_time)
+
+
 def test_is_uiautomator_service_registered_when_found_old_registered_error():
   start_time = '09-20 17:17:19.551'
   mock_ad = mock.Mock()